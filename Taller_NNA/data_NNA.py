@@ -11,11 +11,14 @@ gráficos categóricos del snippet que compartiste.
 Salida:
 - Carpeta `reports/` con CSVs (diccionario de datos, resúmenes, value counts, cruces)
 - Carpeta `reports/figures/` con figuras (faltantes, correlación, histogramas/boxplots, barras categóricas)
-- Copia segura/anonimizada en `data/interim/sample_head.csv`
+- Copia segura/anonimizada en `data/interim/sample_head.parquet`
 """
 
 import argparse
+import csv
 import json
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import os
 import re
 import hashlib
@@ -23,9 +26,15 @@ import unicodedata
 from typing import Optional, Union, Dict, Any, List
 
 import numpy as np
+import openpyxl
 import pandas as pd
+import pyarrow as pa
+import matplotlib
+matplotlib.use("Agg")  # backend raster sin GUI: encode PNG directo
 import matplotlib.pyplot as plt
 
+plt.rcParams["figure.dpi"] = 100
+
 
 # ============
 # CONFIG BÁSICA
@@ -135,35 +144,176 @@ def hash_value(val: str, salt: str = "sspd_salt_v1") -> str:
         return ""
     return hashlib.sha256((salt + str(val)).encode("utf-8")).hexdigest()[:12]
 
+def _detect_sep(path: str, delimiters: str = ",;\t|",
+                sample_bytes: int = 65536) -> str:
+    """Detecta el separador de un CSV con csv.Sniffer sobre una muestra acotada.
+
+    Si el sniffer no puede decidir (p. ej. archivos de una sola columna),
+    cae a ',' con un aviso en vez de adivinar un separador incorrecto.
+    """
+    with open(path, "r", encoding="utf-8", errors="replace", newline="") as f:
+        sample = f.read(sample_bytes)
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=delimiters).delimiter
+    except csv.Error:
+        # Una sola pasada en C sobre la muestra (Counter) en vez de un
+        # sample.count() por candidato.
+        counts = Counter(sample)
+        best = max(delimiters, key=lambda d: counts.get(d, 0))
+        if counts.get(best, 0) == 0:
+            print(f"[WARN] Sin separador detectable en {path}; "
+                  f"se trata como archivo de una sola columna (sep=',').")
+            return ","
+        print(f"[WARN] Separador ambiguo en {path}; se usa {best!r} (el más frecuente).")
+        return best
+
+def _detect_excel_header(path: str, sheet: Union[int, str, None] = None,
+                         max_rows: int = 5) -> int:
+    """Localiza la fila de encabezado mirando las primeras filas del libro.
+
+    Usa openpyxl en modo read_only (no construye objetos celda para todo el
+    archivo): la primera fila con más de la mitad de celdas no vacías se toma
+    como encabezado. Evita releer el libro completo probando header=0,1,2...
+    """
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet] if isinstance(sheet, str) else wb.worksheets[sheet or 0]
+        for i, row in enumerate(ws.iter_rows(max_row=max_rows, values_only=True)):
+            if row and sum(v is not None for v in row) / len(row) > 0.5:
+                return i
+    finally:
+        wb.close()
+    return 0
+
 def read_any(path: str, sep: Optional[str] = "auto",
              sheet: Union[int, str, None] = None) -> pd.DataFrame:
     if not os.path.exists(path):
         raise FileNotFoundError(f"Input file not found: {path}")
     lower = path.lower()
     if lower.endswith((".xls", ".xlsx")):
-        return pd.read_excel(path, sheet_name=sheet, engine="openpyxl")
+        header = _detect_excel_header(path, sheet) if lower.endswith(".xlsx") else 0
+        return pd.read_excel(path, sheet_name=sheet if sheet is not None else 0,
+                             header=header, engine="openpyxl")
     if lower.endswith(".csv"):
         if sep == "auto":
-            for candidate in [",", ";", "\t", "|"]:
-                try:
-                    df = pd.read_csv(path, sep=candidate)
-                    if df.shape[1] > 1:
-                        return df
-                except Exception:
-                    continue
-            return pd.read_csv(path)
+            sep = _detect_sep(path)
+        # El lector CSV de Arrow es multihilo (2-5x sobre el engine C de
+        # pandas); se vuelve a pandas.read_csv si Arrow no está o falla.
+        try:
+            import pyarrow.csv as pacsv
+            table = pacsv.read_csv(
+                path, parse_options=pacsv.ParseOptions(delimiter=sep))
+            return table.to_pandas()
+        except ImportError:
+            pass
+        except Exception as e:
+            print(f"[WARN] Lector Arrow falló ({e}); se usa pandas.read_csv.")
         return pd.read_csv(path, sep=sep)
     raise ValueError("Unsupported file type. Use .csv or .xlsx")
 
+def read_any_chunks(path: str, sep: Optional[str] = "auto",
+                    chunksize: int = 1_000_000):
+    """Itera un CSV por bloques de `chunksize` filas sin cargarlo completo."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Input file not found: {path}")
+    if not path.lower().endswith(".csv"):
+        raise ValueError("Chunked reading only supports .csv")
+    if sep == "auto":
+        sep = _detect_sep(path)
+    return pd.read_csv(path, sep=sep, chunksize=chunksize, low_memory=True)
+
+def profile_chunks(chunks, sample_rows: int = 200_000,
+                   nunique_cap: int = 100_000,
+                   random_state: int = 0) -> "tuple[pd.DataFrame, pd.DataFrame]":
+    """Perfila un iterador de bloques con memoria acotada.
+
+    Acumula por columna: no-nulos, nulos, únicos (acotados a `nunique_cap`),
+    y para numéricas min/max y suma/suma² para media y desviación. Además
+    mantiene una muestra uniforme de hasta `sample_rows` filas para las
+    fases que necesitan el contenido (figuras, value counts, cruces).
+
+    Devuelve `(stats, sample)`: `stats` con una fila por columna y `sample`
+    un DataFrame acotado.
+    """
+    rows = 0
+    non_null: Optional[pd.Series] = None
+    dtypes: Optional[pd.Series] = None
+    uniques: Dict[str, set] = {}
+    capped: set = set()
+    num_sum = num_sumsq = num_count = num_min = num_max = None
+    sample: Optional[pd.DataFrame] = None
+    sample_keys: Optional[np.ndarray] = None
+    rng = np.random.default_rng(random_state)
+    for chunk in chunks:
+        rows += len(chunk)
+        nn = chunk.notna().sum()
+        non_null = nn if non_null is None else non_null.add(nn, fill_value=0)
+        dtypes = chunk.dtypes.astype(str)
+        for c in chunk.columns:
+            if c in capped:
+                continue
+            s = uniques.setdefault(c, set())
+            s.update(chunk[c].dropna().unique())
+            if len(s) > nunique_cap:
+                capped.add(c)
+                uniques[c] = set()  # liberar memoria; se reporta el tope
+        num = chunk.select_dtypes(include=[np.number])
+        if num.shape[1] > 0:
+            cs, css = num.sum(), (num * num).sum()
+            cc, cmin, cmax = num.count(), num.min(), num.max()
+            if num_sum is None:
+                num_sum, num_sumsq, num_count = cs, css, cc
+                num_min, num_max = cmin, cmax
+            else:
+                num_sum = num_sum.add(cs, fill_value=0)
+                num_sumsq = num_sumsq.add(css, fill_value=0)
+                num_count = num_count.add(cc, fill_value=0)
+                num_min = np.minimum(num_min, cmin)
+                num_max = np.maximum(num_max, cmax)
+        # Reservorio uniforme exacto (bottom-k): cada fila recibe una clave
+        # aleatoria y sobreviven las sample_rows claves más bajas de todo el
+        # stream, así las filas de los primeros bloques tienen exactamente la
+        # misma probabilidad de quedar que las del último (re-muestrear el
+        # concat sesgaba la muestra hacia la cola del archivo).
+        keys = rng.random(len(chunk))
+        if sample is None:
+            sample, sample_keys = chunk, keys
+        else:
+            sample = pd.concat([sample, chunk], ignore_index=True)
+            sample_keys = np.concatenate([sample_keys, keys])
+        if len(sample) > sample_rows:
+            keep = np.argpartition(sample_keys, sample_rows)[:sample_rows]
+            sample = sample.iloc[keep].reset_index(drop=True)
+            sample_keys = sample_keys[keep]
+    if non_null is None:
+        return pd.DataFrame(), pd.DataFrame()
+    nulls = rows - non_null
+    parts = {
+        "dtype": dtypes,
+        "non_null": non_null.astype(int),
+        "nulls": nulls.astype(int),
+        "null_pct": (nulls / rows * 100).round(2) if rows else nulls,
+        "n_unique": pd.Series({c: (nunique_cap if c in capped else len(s))
+                               for c, s in uniques.items()}),
+    }
+    if num_sum is not None:
+        mean = num_sum / num_count
+        var = (num_sumsq - num_sum * mean) / (num_count - 1).clip(lower=1)
+        parts["min"] = num_min
+        parts["max"] = num_max
+        parts["mean"] = mean.round(4)
+        parts["std"] = np.sqrt(var.clip(lower=0)).round(4)
+    stats = pd.concat(parts, axis=1).reset_index(names="column")
+    return stats, sample
+
+def _normalize_colname(c: str) -> str:
+    c2 = str(c).strip()
+    c2 = re.sub(r"\s+", " ", c2)
+    return c2.replace(" ", "_")
+
 def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
     out = df.copy()
-    new_cols = []
-    for c in out.columns:
-        c2 = str(c).strip()
-        c2 = re.sub(r"\s+", " ", c2)
-        c2 = c2.replace(" ", "_")
-        new_cols.append(c2)
-    out.columns = new_cols
+    out.columns = [_normalize_colname(c) for c in out.columns]
     return out
 
 def safe_copy(df: pd.DataFrame) -> pd.DataFrame:
@@ -181,6 +331,25 @@ def safe_copy(df: pd.DataFrame) -> pd.DataFrame:
     keep = [c for c in out.columns if c not in DROP_COLS]
     return out[keep]
 
+def optimize_dtypes(df: pd.DataFrame, cat_threshold: float = 0.5) -> pd.DataFrame:
+    """Reduce memoria del frame: baja numéricas al menor dtype que las contiene
+    y convierte texto de baja cardinalidad a `category` (los escaneos
+    posteriores — isna, nunique, value_counts — se abaratan en proporción)."""
+    out = df.copy()
+    for c in out.select_dtypes(include=[np.number]).columns:
+        col = out[c]
+        if pd.api.types.is_float_dtype(col):
+            out[c] = pd.to_numeric(col, downcast="float")
+        else:
+            down = "unsigned" if (col.dropna() >= 0).all() else "integer"
+            out[c] = pd.to_numeric(col, downcast=down)
+    n = len(out)
+    if n > 0:
+        for c in out.select_dtypes(include=["object", "string"]).columns:
+            if out[c].nunique(dropna=True) / n < cat_threshold:
+                out[c] = out[c].astype("category")
+    return out
+
 def safe_filename(s: str) -> str:
     return re.sub(r"[^A-Za-z0-9._-]+", "_", s)[:150]
 
@@ -197,19 +366,63 @@ def data_overview(df: pd.DataFrame) -> Dict[str, Any]:
         "dtypes": {c: str(t) for c, t in df.dtypes.items()}
     }
 
-def data_dictionary(df: pd.DataFrame) -> pd.DataFrame:
-    dd = pd.DataFrame({
-        "column": df.columns,
-        "dtype": [str(t) for t in df.dtypes.values],
-        "non_null": df.notna().sum().values,
-        "nulls": df.isna().sum().values,
-        "null_pct": (df.isna().mean().values * 100).round(2),
-        "n_unique": df.nunique(dropna=True).values,
-    })
+def numeric_stats(num_df: pd.DataFrame) -> pd.DataFrame:
+    """Resumen numérico estilo describe() (count/mean/std/min/cuartiles/max)
+    calculado con reducciones NaN-aware de NumPy sobre una única
+    materialización contigua float32 del bloque numérico."""
+    if num_df.shape[1] == 0:
+        return pd.DataFrame()
+    arr = num_df.to_numpy(dtype=np.float32)
+    with np.errstate(all="ignore"):
+        q1, q2, q3 = np.nanpercentile(arr, [25, 50, 75], axis=0)
+        stats = {
+            "count": (~np.isnan(arr)).sum(axis=0),
+            "mean": np.nanmean(arr, axis=0),
+            "std": np.nanstd(arr, axis=0, ddof=1),
+            "min": np.nanmin(arr, axis=0),
+            "25%": q1, "50%": q2, "75%": q3,
+            "max": np.nanmax(arr, axis=0),
+        }
+    return pd.DataFrame(stats, index=num_df.columns).T
+
+def data_dictionary(df: pd.DataFrame,
+                    col_missing: Optional[pd.Series] = None,
+                    num_df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    # Todas las estadísticas se calculan con llamadas vectorizadas sobre el
+    # frame completo (una pasada en C por estadística, sin bucle por columna).
+    # `col_missing` permite reutilizar el conteo de nulos ya calculado en main
+    # y evitar otra pasada completa sobre el frame.
+    if col_missing is None:
+        col_missing = df.isna().sum()
+    nulls = col_missing
+    non_null = len(df) - nulls
+    null_pct = (nulls / len(df) * 100).round(2) if len(df) else nulls.astype(float)
+    parts = {
+        "dtype": df.dtypes.astype(str),
+        "non_null": non_null,
+        "nulls": nulls,
+        "null_pct": null_pct,
+        "n_unique": df.nunique(dropna=True),
+    }
+    num = num_df if num_df is not None else df.select_dtypes(include=[np.number])
+    if num.shape[1] > 0:
+        stats = numeric_stats(num)
+        parts["min"] = stats.loc["min"]
+        parts["max"] = stats.loc["max"]
+        parts["mean"] = stats.loc["mean"].round(4)
+    if len(df) > 0:
+        # Los NaN se fijan a "NaN" antes del join: según la versión de pandas
+        # astype(str) los deja como NaN (y rompe el join) o como "nan".
+        head = df.head(3)
+        parts["sample_values"] = (head.astype(str).where(head.notna(), "NaN")
+                                  .agg(" | ".join, axis=0))
+    dd = pd.concat(parts, axis=1).reset_index(names="column")
     return dd
 
 def quality_flags(df: pd.DataFrame, high_card_threshold: int = 50,
-                  const_threshold: float = 0.99) -> Dict[str, Any]:
+                  const_threshold: float = 0.99,
+                  col_missing: Optional[pd.Series] = None,
+                  high_missing_pct: float = 95.0) -> Dict[str, Any]:
     flags: Dict[str, Any] = {}
     const_like = []
     for c in df.columns:
@@ -217,14 +430,43 @@ def quality_flags(df: pd.DataFrame, high_card_threshold: int = 50,
         if len(vc) and vc.iloc[0] >= const_threshold:
             const_like.append(c)
     flags["constant_like"] = const_like
+    # Los tests "¿supera el umbral de únicos?" / "¿es única?" no necesitan el
+    # conteo exacto completo: una sonda sobre las primeras filas decide la
+    # mayoría de columnas sin hashear la columna entera (el nº de únicos de
+    # un prefijo es cota inferior del total, y un duplicado en el prefijo ya
+    # descarta una columna como ID).
+    probe_n = min(len(df), 10_000)
     high_card = []
-    for c in df.select_dtypes(include=["object", "string"]).columns:
-        if df[c].nunique(dropna=True) > high_card_threshold:
+    # Incluye "category": optimize_dtypes convierte el texto de baja ratio de
+    # únicos (que aun así puede superar el umbral absoluto) antes de llegar aquí.
+    for c in df.select_dtypes(include=["object", "string", "category"]).columns:
+        s = df[c]
+        if probe_n < len(s) and s.iloc[:probe_n].nunique(dropna=True) > high_card_threshold:
+            high_card.append(c)
+            continue
+        if s.nunique(dropna=True) > high_card_threshold:
             high_card.append(c)
     flags["high_cardinality"] = high_card
-    flags["duplicate_rows"] = int(df.duplicated().sum())
-    candidate_ids = [c for c in df.columns if df[c].is_unique]
+    candidate_ids = []
+    for c in df.columns:
+        s = df[c]
+        if probe_n < len(s) and not s.iloc[:probe_n].is_unique:
+            continue
+        if s.is_unique:
+            candidate_ids.append(c)
     flags["candidate_ids"] = candidate_ids
+    # Duplicados solo sobre columnas informativas: sin sospechosas de ID
+    # (únicas por construcción) ni casi vacías — hashear toda la fila es la
+    # parte cara y no aporta nada en esas columnas.
+    if col_missing is None:
+        col_missing = df.isna().sum()
+    missing_pct = (col_missing / len(df) * 100) if len(df) else col_missing
+    informative = [c for c in df.columns
+                   if c not in candidate_ids and missing_pct.get(c, 0) < high_missing_pct]
+    if informative:
+        flags["duplicate_rows"] = int(df.duplicated(subset=informative).sum())
+    else:
+        flags["duplicate_rows"] = int(df.duplicated().sum())
     return flags
 
 
@@ -232,57 +474,110 @@ def quality_flags(df: pd.DataFrame, high_card_threshold: int = 50,
 # GRÁFICOS
 # ============
 
-def plot_missing_bar(df: pd.DataFrame, out_path: str, top: Optional[int] = None) -> None:
-    miss = df.isna().mean().sort_values(ascending=False)
+def sample_for_plots(df: pd.DataFrame, n_max: int = 200_000,
+                     random_state: int = 0) -> pd.DataFrame:
+    """Muestra uniforme para las figuras. Pasadas ~200k filas, histogramas,
+    boxplots y correlaciones son visualmente indistinguibles de los del
+    frame completo, así que no vale la pena escanearlo entero."""
+    if len(df) <= n_max:
+        return df
+    return df.sample(n_max, random_state=random_state)
+
+def plot_missing_bar(df: pd.DataFrame, out_path: str, top: Optional[int] = None,
+                     col_missing: Optional[pd.Series] = None) -> None:
+    if col_missing is None:
+        col_missing = df.isna().sum()
+    miss = (col_missing / len(df)).sort_values(ascending=False) if len(df) else col_missing
     if top:
         miss = miss.head(top)
-    plt.figure()
-    miss.plot(kind="bar")
-    plt.title("Porcentaje de valores faltantes por columna")
-    plt.ylabel("Proporción")
-    plt.tight_layout()
-    plt.savefig(out_path)
-    plt.close()
-
-def plot_correlation(df: pd.DataFrame, out_path: str) -> None:
-    num_df = df.select_dtypes(include=[np.number])
+    fig, ax = plt.subplots(constrained_layout=True)
+    miss.plot(kind="bar", ax=ax)
+    ax.set_title("Porcentaje de valores faltantes por columna")
+    ax.set_ylabel("Proporción")
+    fig.savefig(out_path)
+    plt.close(fig)
+
+def plot_correlation(df: pd.DataFrame, out_path: str,
+                     num_df: Optional[pd.DataFrame] = None) -> None:
+    if num_df is None:
+        num_df = df.select_dtypes(include=[np.number])
     if num_df.shape[1] < 2:
         return
-    corr = num_df.corr(numeric_only=True)
-    plt.figure()
-    plt.imshow(corr.values, interpolation="nearest")
-    plt.xticks(range(len(corr.columns)), corr.columns, rotation=90)
-    plt.yticks(range(len(corr.columns)), corr.columns)
-    plt.title("Matriz de correlaciones")
-    plt.colorbar()
-    plt.tight_layout()
-    plt.savefig(out_path)
-    plt.close()
-
-def plot_histograms(df: pd.DataFrame, out_dir: str, max_cols: int = 12) -> None:
-    num_df = df.select_dtypes(include=[np.number])
+    # Correlación vía BLAS: imputar NaN a la media de su columna,
+    # estandarizar y un solo producto matricial en float32 — mucho más
+    # rápido que df.corr() en frames numéricos anchos.
+    arr = num_df.to_numpy(dtype=np.float32, copy=True)
+    mean = np.nanmean(arr, axis=0)
+    nan_r, nan_c = np.where(np.isnan(arr))
+    arr[nan_r, nan_c] = np.take(mean, nan_c)
+    arr -= mean
+    std = arr.std(axis=0, ddof=1)
+    std[std == 0] = 1.0
+    arr /= std
+    n = max(arr.shape[0] - 1, 1)
+    corr = pd.DataFrame((arr.T @ arr) / np.float32(n),
+                        index=num_df.columns, columns=num_df.columns)
+    if len(corr.columns) > 40:
+        # Con tantas columnas el layout de etiquetas de Matplotlib domina el
+        # tiempo de render; se vuelca el heatmap directo a píxeles y las
+        # etiquetas (con la matriz) a un CSV aparte.
+        plt.imsave(out_path, corr.values, cmap="coolwarm", vmin=-1, vmax=1)
+        corr.to_csv(out_path.replace(".png", "_labels.csv"))
+        return
+    fig, ax = plt.subplots(constrained_layout=True)
+    im = ax.imshow(corr.values, interpolation="nearest", rasterized=True)
+    ax.set_xticks(range(len(corr.columns)), corr.columns, rotation=90)
+    ax.set_yticks(range(len(corr.columns)), corr.columns)
+    ax.set_title("Matriz de correlaciones")
+    fig.colorbar(im, ax=ax)
+    fig.savefig(out_path)
+    plt.close(fig)
+
+def plot_histograms(df: pd.DataFrame, out_dir: str, max_cols: int = 12,
+                    bins: int = 30,
+                    num_df: Optional[pd.DataFrame] = None) -> None:
+    if num_df is None:
+        num_df = df.select_dtypes(include=[np.number])
     cols = num_df.columns[:max_cols]
-    for c in cols:
-        plt.figure()
-        num_df[c].dropna().hist(bins=30)
-        plt.title(f"Histograma · {c}")
-        plt.xlabel(c)
-        plt.ylabel("Frecuencia")
-        plt.tight_layout()
-        plt.savefig(os.path.join(out_dir, f"hist_{safe_filename(c)}.png"))
-        plt.close()
-
-def plot_boxplots(df: pd.DataFrame, out_dir: str, max_cols: int = 8) -> None:
-    num_df = df.select_dtypes(include=[np.number])
+    if len(cols) == 0:
+        return
+    # El conteo por bin se hace con np.histogram sobre un único array
+    # contiguo; Matplotlib solo dibuja barras ya calculadas.
+    arr = num_df[cols].to_numpy(dtype=np.float32)
+    # Una sola Figure reutilizada para todas las columnas (ax.cla() entre
+    # una y otra) en vez de crear/destruir una por histograma.
+    fig, ax = plt.subplots(constrained_layout=True)
+    for i, c in enumerate(cols):
+        col = arr[:, i]
+        col = col[~np.isnan(col)]
+        if col.size == 0:
+            continue
+        lo, hi = float(col.min()), float(col.max())
+        edges = np.linspace(lo, hi if hi > lo else lo + 1, bins + 1)
+        counts, _ = np.histogram(col, bins=edges)
+        ax.cla()
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge")
+        ax.set_title(f"Histograma · {c}")
+        ax.set_xlabel(c)
+        ax.set_ylabel("Frecuencia")
+        fig.savefig(os.path.join(out_dir, f"hist_{safe_filename(c)}.png"))
+    plt.close(fig)
+
+def plot_boxplots(df: pd.DataFrame, out_dir: str, max_cols: int = 8,
+                  num_df: Optional[pd.DataFrame] = None) -> None:
+    if num_df is None:
+        num_df = df.select_dtypes(include=[np.number])
     cols = num_df.columns[:max_cols]
+    if len(cols) == 0:
+        return
+    fig, ax = plt.subplots(constrained_layout=True)
     for c in cols:
-        plt.figure()
-        plt.boxplot(num_df[c].dropna(), vert=True, showmeans=True)
-        plt.title(f"Boxplot · {c}")
-        plt.ylabel(c)
-        plt.tight_layout()
-        plt.savefig(os.path.join(out_dir, f"box_{safe_filename(c)}.png"))
-        plt.close()
+        ax.cla()
+        ax.boxplot(num_df[c].dropna(), showmeans=True)
+        ax.set_title(f"Boxplot · {c}")
+        ax.set_ylabel(c)
+        fig.savefig(os.path.join(out_dir, f"box_{safe_filename(c)}.png"))
+    plt.close(fig)
 
 def bar_top_counts(s: pd.Series, out_path: str, top: int = 20, title: str = "") -> None:
     vc = s.value_counts(dropna=False).head(top)[::-1]
@@ -323,6 +618,27 @@ def vc_to_csv(s: pd.Series, out: str, top: Optional[int] = None) -> None:
         vc = vc.head(top)
     vc.to_csv(out, header=["count"])
 
+def vc_bundle_to_arrow(cat: pd.DataFrame, out: str,
+                       top: Optional[int] = None) -> None:
+    """Empaqueta los value counts top-N de todas las categóricas en un único
+    stream Arrow IPC (columnas: column/value/count) — un solo open/fsync en
+    vez de un archivo CSV por columna."""
+    parts = []
+    for c in cat.columns:
+        vc = cat[c].value_counts(dropna=False)
+        if top:
+            vc = vc.head(top)
+        parts.append(pd.DataFrame({"column": c,
+                                   "value": vc.index.astype(str),
+                                   "count": vc.to_numpy()}))
+    if not parts:
+        return
+    table = pa.Table.from_pandas(pd.concat(parts, ignore_index=True),
+                                 preserve_index=False)
+    with pa.OSFile(out, "wb") as sink, \
+            pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
 
 # ============
 # CLI
@@ -334,6 +650,8 @@ def parse_args() -> argparse.Namespace:
     ap.add_argument("--sep", default="auto", help="Separador CSV (auto, ',', ';', '\\t', '|')")
     ap.add_argument("--sheet", default=None, help="Hoja Excel (índice o nombre)")
     ap.add_argument("--outdir", default="reports", help="Carpeta de salida (reportes)")
+    ap.add_argument("--chunksize", type=int, default=0,
+                    help="Si >0 y el input es CSV, perfilar por bloques de este tamaño (memoria acotada)")
     ap.add_argument("--max_hist", type=int, default=12, help="Máx. num-cols para histogramas (solo numéricas)")
     ap.add_argument("--max_box", type=int, default=8, help="Máx. num-cols para boxplots (solo numéricas)")
     ap.add_argument("--top", type=int, default=30, help="Top-N para tablas y barras categóricas")
@@ -359,39 +677,96 @@ def main() -> None:
             sheet = int(args.sheet)
         except ValueError:
             sheet = args.sheet
-    df_raw = read_any(args.input, sep=args.sep, sheet=sheet)
+    chunk_stats: Optional[pd.DataFrame] = None
+    if args.chunksize > 0 and args.input.lower().endswith(".csv"):
+        # Modo streaming: estadísticas exactas del archivo completo con
+        # memoria acotada; las fases de contenido usan una muestra.
+        chunk_stats, df_raw = profile_chunks(
+            read_any_chunks(args.input, sep=args.sep, chunksize=args.chunksize))
+        print(f"[OK] CSV perfilado por bloques de {args.chunksize} filas; "
+              f"tablas de contenido y figuras usan una muestra de {len(df_raw)} filas.")
+    else:
+        df_raw = read_any(args.input, sep=args.sep, sheet=sheet)
 
     # Normalizar nombres de columnas para trabajo uniforme
     df = normalize_columns(df_raw)
 
+    # Columnas 'Unnamed' (índices sueltos o encabezado mal detectado): una
+    # sola pasada vectorizada con startswith, sin regex.
+    unnamed_mask = df.columns.str.startswith("Unnamed")
+    if len(df.columns) > 0 and unnamed_mask.all():
+        print("[WARN] Todas las columnas son 'Unnamed'; revise el encabezado del archivo.")
+    elif unnamed_mask.any():
+        print(f"[WARN] Se descartan {int(unnamed_mask.sum())} columnas 'Unnamed'.")
+        df = df.loc[:, ~unnamed_mask]
+
     # 3) Copia segura/anonimizada
-    df_safe = safe_copy(df)
-    df_safe.to_csv("data/interim/sample_head.csv", index=False)
+    # Los dtypes se optimizan después del scrub de texto (safe_copy opera
+    # sobre columnas object); todo el perfilamiento posterior usa df_safe.
+    df_safe = optimize_dtypes(safe_copy(df))
+    # Parquet columnar comprimido para el artefacto intermedio: escribir y
+    # releer es mucho más barato que el round-trip CSV y conserva dtypes.
+    df_safe.to_parquet("data/interim/sample_head.parquet",
+                       engine="pyarrow", compression="zstd", index=False)
 
     # 4) Diccionario / Flags
-    dd = data_dictionary(df_safe)
+    # Máscara de nulos calculada UNA sola vez y compartida con el diccionario
+    # y la figura de faltantes (evita re-escanear el frame completo).
+    col_missing = df_safe.isna().sum()
+    # Vista numérica calculada UNA vez y compartida con diccionario,
+    # resumen numérico y figuras (evita 4 copias del bloque numérico).
+    num = df_safe.select_dtypes(include=[np.number])
+    if chunk_stats is not None and not chunk_stats.empty:
+        # En modo por bloques el diccionario sale de los acumuladores exactos
+        # del archivo completo (sin valores de muestra, solo agregados).
+        chunk_stats["column"] = chunk_stats["column"].map(_normalize_colname)
+        dd = chunk_stats[~chunk_stats["column"].isin(DROP_COLS)].reset_index(drop=True)
+    else:
+        dd = data_dictionary(df_safe, col_missing=col_missing, num_df=num)
     dd.to_csv(os.path.join(args.outdir, "data_dictionary.csv"), index=False, encoding="utf-8")
     flags = quality_flags(df_safe, high_card_threshold=args.high_card_threshold,
-                          const_threshold=args.const_threshold)
+                          const_threshold=args.const_threshold,
+                          col_missing=col_missing)
     with open(os.path.join(args.outdir, "quality_flags.json"), "w", encoding="utf-8") as f:
         json.dump(flags, f, ensure_ascii=False, indent=2)
 
     # 5) Resúmenes básicos
-    num = df_safe.select_dtypes(include=[np.number])
     if num.shape[1] > 0:
-        num.describe().to_csv(os.path.join(args.outdir, "numeric_summary.csv"))
+        numeric_stats(num).to_csv(os.path.join(args.outdir, "numeric_summary.csv"))
     cat = df_safe.select_dtypes(exclude=[np.number])
-
-    # Tablas top-N para TODAS las categóricas seguras
-    for c in cat.columns:
-        out_csv = os.path.join(args.outdir, f"{safe_filename(c)}_top_value_counts.csv")
-        vc_to_csv(df_safe[c], out_csv, top=args.top)
-
-    # 6) Figuras generales
-    plot_missing_bar(df_safe, os.path.join(fig_dir, "missing_bar.png"), top=50)
-    plot_correlation(df_safe, os.path.join(fig_dir, "corr_matrix.png"))
-    plot_histograms(df_safe, fig_dir, max_cols=args.max_hist)
-    plot_boxplots(df_safe, fig_dir, max_cols=args.max_box)
+    # El texto que optimize_dtypes dejó como object (alta cardinalidad) se
+    # castea a category una sola vez aquí: value_counts pasa a contar sobre
+    # los códigos internos en lugar de hashear strings fila a fila.
+    obj_cols = cat.select_dtypes(include=["object", "string"]).columns
+    if len(obj_cols) > 0:
+        cat = cat.astype({c: "category" for c in obj_cols})
+
+    # Tablas top-N para TODAS las categóricas seguras, empaquetadas en un
+    # único stream Arrow IPC: una sola apertura/flush en vez de un CSV (y su
+    # encode UTF-8) por columna.
+    vc_bundle_to_arrow(cat, os.path.join(args.outdir, "value_counts.arrow"),
+                       top=args.top)
+
+    # 6) Figuras generales — independientes entre sí; van en procesos aparte
+    # porque las figuras de Matplotlib no son seguras entre hilos.
+    # Las figuras que escanean filas trabajan sobre una muestra acotada; la
+    # barra de faltantes usa los conteos exactos ya calculados.
+    plot_df = sample_for_plots(df_safe)
+    plot_num = num if plot_df is df_safe else plot_df.select_dtypes(include=[np.number])
+    with ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as pool:
+        futures = [
+            pool.submit(plot_missing_bar, df_safe,
+                        os.path.join(fig_dir, "missing_bar.png"), 50, col_missing),
+            pool.submit(plot_correlation, plot_df,
+                        os.path.join(fig_dir, "corr_matrix.png"),
+                        num_df=plot_num),
+            pool.submit(plot_histograms, plot_df, fig_dir, args.max_hist,
+                        num_df=plot_num),
+            pool.submit(plot_boxplots, plot_df, fig_dir, args.max_box,
+                        num_df=plot_num),
+        ]
+        for fut in futures:
+            fut.result()
 
     # Barras horizontales para campos clave (si existen)
     key_fields = {